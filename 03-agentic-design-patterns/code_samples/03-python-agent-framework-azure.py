@@ -62,24 +62,53 @@
 # - **Documentation**: Self-documenting code with clear intent
 
 # 📦 Import Core Libraries for Agent Design Patterns
-import os                     # Environment variable access for configuration management
-from random import randint    # Random selection utilities for tool functionality
+import random                 # Random selection utilities for tool functionality
 import asyncio               # Asynchronous programming support
+import logging                # Debug-level diagnostics for agent setup
+from typing import Final      # Constant annotations for stable agent configuration
+from pathlib import Path      # Locate the saved thread file next to this script
 
 from dotenv import load_dotenv  # Secure environment configuration loading
 
 
 # 🤖 Import Microsoft Agent Framework Components  
 # ChatAgent: Core agent orchestration class following factory pattern
-# AzureOpenAIChatClient: Azure OpenAI Models integration following adapter pattern
 from agent_framework import ChatAgent
-from agent_framework.azure import AzureOpenAIChatClient
+
+# travel_common.py lives at the repository root; run with PYTHONPATH=. from there (see AGENTS.md)
+from travel_common import (  # Shared travel helpers
+    get_azure_client, load_thread, resume_thread_enabled, save_thread, tool_names,
+)
 
 # 🔧 Configuration Loading Pattern
 # Implement configuration management pattern for secure credential handling
 # This follows the external configuration principle for cloud-native applications
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+# 💾 Saved conversation thread (see travel_common.resume_thread_enabled)
+THREAD_PATH: Final = Path(__file__).with_name(".agent_thread.json")
+
+# 📚 Data Repository Pattern: Centralized destination data management
+# Defined once at module level as an immutable tuple so tool calls never rebuild it
+_DESTINATIONS: Final[tuple[str, ...]] = (
+    "Barcelona, Spain",      # Mediterranean cultural hub
+    "Paris, France",         # European artistic center
+    "Berlin, Germany",       # Historical European capital
+    "Tokyo, Japan",          # Asian technology metropolis
+    "Sydney, Australia",     # Oceanic coastal city
+    "New York, USA",         # American urban center
+    "Cairo, Egypt",          # African historical capital
+    "Cape Town, South Africa", # African scenic destination
+    "Rio de Janeiro, Brazil",  # South American beach city
+    "Bali, Indonesia"          # Southeast Asian island paradise
+)
+
+# 🎰 Dedicated random number generator, independent of the global random state
+# Seed it (e.g. random.Random(42)) to make destination picks reproducible
+_rng = random.Random()
+
 # 🛠️ Tool Function Design Pattern
 # Implements the Strategy Pattern for pluggable agent capabilities
 # This demonstrates clean separation of business logic from agent orchestration
@@ -94,51 +123,33 @@ def get_random_destination() -> str:
     Returns:
         str: A randomly selected destination following consistent format
     """
-    # Data Repository Pattern: Centralized destination data management
-    destinations = [
-        "Barcelona, Spain",      # Mediterranean cultural hub
-        "Paris, France",         # European artistic center
-        "Berlin, Germany",       # Historical European capital
-        "Tokyo, Japan",          # Asian technology metropolis
-        "Sydney, Australia",     # Oceanic coastal city
-        "New York, USA",         # American urban center
-        "Cairo, Egypt",          # African historical capital
-        "Cape Town, South Africa", # African scenic destination
-        "Rio de Janeiro, Brazil",  # South American beach city
-        "Bali, Indonesia"          # Southeast Asian island paradise
-    ]
-    
     # Factory Method Pattern: Create destination selection on demand
-    return destinations[randint(0, len(destinations) - 1)]
+    return _rng.choice(_DESTINATIONS)
 
 
-async def main():
+AGENT_INSTRUCTIONS: Final[str] = """You are a helpful AI Agent that can help plan vacations for customers.
 
-    # 🌐 Azure OpenAI Client Integration Pattern
-    azure_openai_chat_client = AzureOpenAIChatClient(
-            api_key=os.environ.get("AZURE_OPENAI_API_KEY"), 
-            endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT"),
-            deployment_name=os.environ.get("AZURE_OPENAI_CHAT_DEPLOYMENT_NAME"),
-            api_version=os.environ.get("AZURE_OPENAI_API_VERSION")
-        )
+Important: When users specify a destination, always plan for that location. Only suggest random destinations when the user hasn't specified a preference.
 
-    AGENT_NAME ="TravelAgent"
+When the conversation begins, introduce yourself with this message:
+"Hello! I'm your TravelAgent assistant. I can help plan vacations and suggest interesting destinations for you. Here are some things you can ask me:
+1. Plan a day trip to a specific location
+2. Suggest a random vacation destination
+3. Find destinations with specific features (beaches, mountains, historical sites, etc.)
+4. Plan an alternative trip if you don't like my first suggestion
 
-    AGENT_INSTRUCTIONS = """You are a helpful AI Agent that can help plan vacations for customers.
+What kind of trip would you like me to help you plan today?"
 
-    Important: When users specify a destination, always plan for that location. Only suggest random destinations when the user hasn't specified a preference.
+Always prioritize user preferences. If they mention a specific destination like "Bali" or "Paris," focus your planning on that location rather than suggesting alternatives.
+"""
 
-    When the conversation begins, introduce yourself with this message:
-    "Hello! I'm your TravelAgent assistant. I can help plan vacations and suggest interesting destinations for you. Here are some things you can ask me:
-    1. Plan a day trip to a specific location
-    2. Suggest a random vacation destination
-    3. Find destinations with specific features (beaches, mountains, historical sites, etc.)
-    4. Plan an alternative trip if you don't like my first suggestion
 
-    What kind of trip would you like me to help you plan today?"
+async def main():
 
-    Always prioritize user preferences. If they mention a specific destination like "Bali" or "Paris," focus your planning on that location rather than suggesting alternatives.
-    """
+    # 🌐 Azure OpenAI Client Integration Pattern
+    azure_openai_chat_client = get_azure_client()
+
+    AGENT_NAME ="TravelAgent"
 
     # 🛠️ Tool Registry Pattern
     AGENT_TOOLS = [get_random_destination]
@@ -154,12 +165,13 @@ async def main():
     # print that agent is created with instructions and tools
     print("🤖 Agent created with the following instructions:")
     print(AGENT_INSTRUCTIONS)
-    print("🛠️ Tools available to the agent:")
-    print([tool.__name__ for tool in AGENT_TOOLS])
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🛠️ Tools available to the agent: %s", tool_names(AGENT_TOOLS))
     print("\n")
 
     # 🧵 Conversation Management Pattern
-    thread = agent.get_new_thread()
+    resume_thread = resume_thread_enabled()
+    thread = await load_thread(agent, THREAD_PATH) if resume_thread else agent.get_new_thread()
 
     # 🚀 Run the Agent
     # Send a message to the agent and get a response
@@ -167,24 +179,19 @@ async def main():
     user_message = "Plan me a day trip"
     print(f"👤 User: {user_message}")
 
-    response1 = await agent.run(user_message, thread=thread)
-
     print("\n")
-    # 📋 View Raw Response Object
-    # This shows the complete response structure including metadata
-    # Useful for debugging and understanding the response format
-    # print("\n📝 Raw Response Object:")
-    # print(response1) 
-
-
-    # 📖 Extract and Display the Travel Plan
-    # Get the last message from the conversation (agent's response)s
-    last_message = response1.messages[-1]
-    # Extract the text content from the message
-    text_content = last_message.contents[0].text
-    # Display the formatted travel plan
+    # 📖 Stream and Display the Travel Plan
+    # Print each chunk of the agent's reply as soon as it arrives instead of
+    # waiting for the full completion
     print("🏖️ Travel plan:")
-    print(text_content)
+    async for update in agent.run_stream(user_message, thread=thread):
+        if update.text:
+            print(update.text, end="", flush=True)
+    print()
+
+    # 💾 Save the conversation so the next run continues it
+    if resume_thread:
+        await save_thread(thread, THREAD_PATH)
 
 
 if __name__ == "__main__":
@@ -85,30 +85,160 @@
 # This sets up the essential libraries for building intelligent agents with tool capabilities
 
 import asyncio
+import logging
 import os
-import json
-import requests
+import time
+import httpx
+import orjson  # Fast JSON parsing/serialization for large SerpAPI payloads
 
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
 from dotenv import load_dotenv  # For loading environment variables securely
-from random import randint
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 # These are the core components for building tool-enabled agents
 from agent_framework import ChatAgent           # Main agent class
-from agent_framework import ai_function # Decorator for defining AI functions (tools)
-from agent_framework.azure import AzureOpenAIChatClient  # Azure OpenAI-compatible client
+from agent_framework import ai_function # Wraps functions as AI functions (tools)
+
+# travel_common.py lives at the repository root; run with PYTHONPATH=. from there (see AGENTS.md)
+from travel_common import (  # Shared travel helpers
+    get_azure_client, load_thread, resume_thread_enabled, save_thread, tool_names,
+)
 
 # Pydantic for strong typing and data validation in tool definitions
-from typing import Annotated
+from typing import Annotated, Final
 from pydantic import Field
 
 
 # Load environment variables from .env file for secure configuration
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+# 💾 Saved conversation thread (see travel_common.resume_thread_enabled)
+THREAD_PATH: Final = Path(__file__).with_name(".agent_thread.json")
+
+# 🔑 SerpAPI configuration, read once at import instead of on every tool call
+_SERP_KEY = os.environ.get("SERP_API_KEY")
+_SERP_URL = os.environ.get("SERP_API_BASE_URL") or "https://serpapi.com/search"
+
+# 🌐 Shared HTTP client for SerpAPI calls
+# A single AsyncClient keeps connections alive between tool calls, so repeated
+# lookups reuse the same TCP/TLS session and never block the event loop.
+# Explicit timeouts stop a stalled socket from hanging the whole agent turn
+@lru_cache(maxsize=1)
+def _serp_client():
+    """Get the shared SerpAPI HTTP client, creating it on first use."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
+# 🗄️ In-process LRU cache of SerpAPI responses
+# Hotel and flight results are stable for a few minutes, so identical searches are
+# answered from memory instead of spending another round-trip and API quota.
+# Entries hold the trimmed result (not the full payload) with the time it was
+# fetched, and are treated as misses once they are older than the TTL
+_SERP_CACHE_SIZE = 512
+_SERP_CACHE_TTL = 300  # seconds
+_SERP_CACHE = OrderedDict()
+
+
+# 🔁 Retry Policy
+# Transient failures (network errors, rate limiting, server errors) are retried
+# with exponential backoff and jitter; other HTTP errors fail immediately
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _is_transient(exc):
+    """Decide whether a failed SerpAPI request is worth retrying."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRY_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.5, max=4),
+    retry=retry_if_exception(_is_transient),
+    reraise=True,
+)
+async def _serp_get(params):
+    """Send a single SerpAPI GET request, raising on HTTP error statuses."""
+    response = await _serp_client().get(_SERP_URL, params=params)
+    response.raise_for_status()
+    return response
+
+
+async def _serp_call(params, trim):
+    """Send a SerpAPI GET request, reusing recent results for repeated params.
+
+    Parameters:
+    - params: The SerpAPI query parameters
+    - trim: Function reducing the parsed JSON response to the fields the agent needs
+    Returns:
+    - list | None: The trimmed response, or None if the request failed
+    """
+    # The API key is left out of the cache key so it never varies the lookup
+    key = tuple(sorted((k, v) for k, v in params.items() if k != "api_key"))
+    entry = _SERP_CACHE.get(key)
+    if entry is not None:
+        fetched_at, result = entry
+        if time.monotonic() - fetched_at < _SERP_CACHE_TTL:
+            _SERP_CACHE.move_to_end(key)
+            return result
+        # Stale entry: drop it and fetch fresh prices
+        del _SERP_CACHE[key]
+
+    try:
+        response = await _serp_get(params)
+    except httpx.HTTPError:
+        # Failed requests are not cached so the next call retries them
+        return None
+
+    result = trim(orjson.loads(response.content))
+    _SERP_CACHE[key] = (time.monotonic(), result)
+    if len(_SERP_CACHE) > _SERP_CACHE_SIZE:
+        _SERP_CACHE.popitem(last=False)
+    return result
+
+
+# ✂️ Response trimming
+# SerpAPI responses are huge; only the fields the agent formats into its tables
+# are sent back to the model, which keeps tool results (and tokens) small
+_FLIGHT_FIELDS = ("total_duration", "price", "type", "carbon_emissions")
+_FLIGHT_LEG_FIELDS = (
+    "airline", "flight_number", "departure_airport", "arrival_airport", "duration",
+    "airplane", "travel_class", "legroom", "extensions",
+)
+_HOTEL_FIELDS = (
+    "name", "description", "check_in_time", "check_out_time", "rate_per_night",
+    "total_rate", "nearby_places", "hotel_class", "gps_coordinates",
+)
+
+
+def _pick(item, fields):
+    """Keep only the whitelisted fields of a SerpAPI result item."""
+    return {k: item[k] for k in fields if k in item}
+
+
+def _trim_flights(response):
+    """Reduce a google_flights response to the fields used in the flight table."""
+    return [
+        {**_pick(flight, _FLIGHT_FIELDS),
+         "flights": [_pick(leg, _FLIGHT_LEG_FIELDS) for leg in flight.get("flights", [])]}
+        for flight in response.get("best_flights", []) + response.get("other_flights", [])
+    ]
+
+
+def _trim_hotels(response):
+    """Reduce a google_hotels response to the fields used in the hotel table."""
+    return [_pick(hotel, _HOTEL_FIELDS) for hotel in response.get("properties", [])]
+
 
 # Define Booking Tools
-@ai_function(max_invocations=3)
-def booking_hotel(
+async def booking_hotel(
     query: Annotated[str, "The name of the city"], 
     check_in_date: Annotated[str, "Hotel Check-in Time"], 
     check_out_date: Annotated[str, "Hotel Check-out Time"],
@@ -133,26 +263,21 @@ def booking_hotel(
         "currency": "USD",
         "gl": "us",
         "hl": "en",
-        "api_key": os.environ.get("SERP_API_KEY")
+        "api_key": _SERP_KEY
     }
 
-    serp_base_url = os.environ.get("SERP_API_BASE_URL") or "https://serpapi.com/search"
-    
-    response = requests.get(serp_base_url, params=params)
+    response = await _serp_call(params, _trim_hotels)
 
     # Check if the request was successful
-    if response.status_code == 200:
-        # Parse the response content as JSON
-        response = response.json()
-        # Return the properties from the response
-        return response["properties"]
+    if response is not None:
+        # Return the trimmed properties from the response as compact JSON
+        return orjson.dumps(response).decode()
     else:
         # Return None if the request failed
         return "request failed"
 
 
-@ai_function(max_invocations=3)
-def booking_flight(
+async def booking_flight(
     origin: Annotated[str, "The name of Departure"], 
     destination: Annotated[str, "The name of Destination"], 
     outbound_date: Annotated[str, "The date of outbound flight"], 
@@ -171,149 +296,174 @@ def booking_flight(
     - The result of booking flight information
     """
     
-    # Define the parameters for the outbound flight request
-    go_params = {
+    # Define the parameters shared by the outbound and return flight requests
+    base_params = {
         "engine": "google_flights",
-        "departure_id": origin,
-        "arrival_id": destination,
         "outbound_date": outbound_date,
         "return_date": return_date,
         "currency": "USD",
         "hl": "en",
-        "api_key": os.environ.get("SERP_API_KEY")
+        "api_key": _SERP_KEY
     }
 
-    print(go_params)
+    # The outbound and return requests only differ in direction
+    go_params = {**base_params, "departure_id": origin, "arrival_id": destination}
+    back_params = {**base_params, "departure_id": destination, "arrival_id": origin}
 
-    # Send the GET request for the outbound flight
-    serp_base_url = os.environ.get("SERP_API_BASE_URL") or "https://serpapi.com/search"
+    print(go_params)
 
-    go_response = requests.get(serp_base_url, params=go_params)
+    # Send the outbound and return GET requests concurrently
+    go_response, back_response = await asyncio.gather(
+        _serp_call(go_params, _trim_flights),
+        _serp_call(back_params, _trim_flights),
+    )
 
-    # Initialize the result string
-    result = ''
+    # Collect the trimmed flight lists, keyed by direction
+    flights = {}
 
     # Check if the outbound flight request was successful
-    if go_response.status_code == 200:
-        # Parse the response content as JSON
-        response = go_response.json()
-        # Append the outbound flight information to the result
-        result += "# outbound \n " + str(response)
+    if go_response is not None:
+        # Add the outbound flight information to the result
+        flights["outbound"] = go_response
     else:
         # Print an error message if the request failed
         print('error with outbound request')
 
-    # Define the parameters for the return flight request
-    back_params = {
-        "engine": "google_flights",
-        "departure_id": destination,
-        "arrival_id": origin,
-        "outbound_date": outbound_date,
-        "return_date": return_date,
-        "currency": "USD",
-        "hl": "en",
-        "api_key": os.environ.get("SERP_API_KEY")
-    }
-
-    # Send the GET request for the return flight
-    serp_base_url = os.environ.get("SERP_API_BASE_URL") or "https://serpapi.com/search"
-    back_response = requests.get(serp_base_url, params=back_params)
-
     # Check if the return flight request was successful
-    if back_response.status_code == 200:
-        # Parse the response content as JSON
-        response = back_response.json()
-        # Append the return flight information to the result
-        result += "\n # return \n" + str(response)
+    if back_response is not None:
+        # Add the return flight information to the result
+        flights["return"] = back_response
     else:
         # Print an error message if the request failed
         print('error with return request')
 
+    # Serialize both directions in a single pass
+    result = orjson.dumps(flights).decode() if flights else "request failed"
+
     # Print the result
     print(result)
 
     # Return the result
     return result
 
-async def main():
 
-    # 🌐 Azure OpenAI Client Integration Pattern
-    azure_openai_chat_client = AzureOpenAIChatClient(
-            api_key=os.environ.get("AZURE_OPENAI_API_KEY"), 
-            endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT"),
-            deployment_name=os.environ.get("AZURE_OPENAI_CHAT_DEPLOYMENT_NAME"),
-            api_version=os.environ.get("AZURE_OPENAI_API_VERSION")
-        )
-
-    AGENT_NAME ="BookingAgent"
+# 📝 Compact system prompt: it is sent with every request, so every token counts
+AGENT_INSTRUCTIONS: Final[str] = (
+    "You are a booking agent for flights and hotels. "
+    "For flights, convert departure and destination names to airport codes. "
+    "Call the matching booking tool; assume sensible defaults for missing parameters. "
+    "For anything else, answer directly. "
+    "Output flights as markdown tables, outbound and return separately: "
+    "Dep|Airline|Flight#|DepTime|Arr|ArrTime|Dur|Plane|Class|Price(USD)|Legroom|Ext|CO2(kg). "
+    "Output hotels as: Name|Desc|CheckIn|CheckOut|Price|Nearby|Class|GPS."
+)
+
+
+# 🛠️ Tool Registry Pattern
+# max_invocations is counted on the tool object itself, so every agent gets freshly
+# wrapped tools; otherwise concurrent prompts would share (and exhaust) one limit
+def create_agent_tools():
+    """Wrap the booking functions as agent tools with their own invocation limits."""
+    return [
+        ai_function(max_invocations=3)(booking_hotel),
+        ai_function(max_invocations=3)(booking_flight),
+    ]
 
-    AGENT_INSTRUCTIONS = """
-    You are a booking agent, help me to book flights or hotels.
 
-    Thought: Understand the user's intention and confirm whether to use the reservation system to complete the task.
+async def main():
 
-    Action:
-    - If booking a flight, convert the departure name and destination name into airport codes.
-    - If booking a hotel or flight, use the corresponding API to call. Ensure that the necessary parameters are available. If any parameters are missing, use default values or assumptions to proceed.
-    - If it is not a hotel or flight booking, respond with the final answer only.
-    - Output the results using a markdown table:
-    - For flight bookings, separate the outbound and return contents and list them in the order of Departure_airport Name | Airline | Flight Number | Departure Time | Arrival_airport Name | Arrival Time | Duration | Airplane | Travel Class | Price (USD) | Legroom | Extensions | Carbon Emissions (kg).
-    - For hotel bookings, list them in the order of Properties Name | Properties description | check_in_time | check_out_time | prices | nearby_places | hotel_class | gps_coordinates.
-    """
+    # 🌐 Azure OpenAI Client Integration Pattern
+    azure_openai_chat_client = get_azure_client()
 
-    # 🛠️ Tool Registry Pattern
-    AGENT_TOOLS = [booking_hotel, booking_flight]
+    AGENT_NAME ="BookingAgent"
 
     # 🤖 Agent Factory Pattern
-    agent = ChatAgent(
-        name = AGENT_NAME,
-        chat_client=azure_openai_chat_client,
-        instructions=AGENT_INSTRUCTIONS,
-        tools=AGENT_TOOLS
-    )
+    def create_agent():
+        return ChatAgent(
+            name = AGENT_NAME,
+            chat_client=azure_openai_chat_client,
+            instructions=AGENT_INSTRUCTIONS,
+            tools=create_agent_tools()
+        )
 
-    # print that agent is created with instructions and tools
+    # print the agent instructions and tools
     print("🤖 Agent created with the following instructions:")
     print(AGENT_INSTRUCTIONS)
-    print("🛠️ Tools available to the agent:")
-    print([tool.func.__name__ for tool in AGENT_TOOLS])
-    print([getattr(tool, '__name__', str(tool)) for tool in AGENT_TOOLS])
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🛠️ Tools available to the agent: %s", tool_names(create_agent_tools()))
     print("\n")
 
-    # 🧵 Conversation Management Pattern
-    thread = agent.get_new_thread()
-
     # 🚀 Run the Agent
     # This is your prompt for the activity or task you want to complete 
     # Define user inputs for the agent to process we have provided some example prompts to test and validate 
     user_inputs = [
-        # "Can you tell me the round-trip air ticket from  London to New York JFK aiport, the departure time is February 17, 2025, and the return time is February 23, 2025"
-        # "Book a hotel in New York from Feb 20,2026 to Feb 24,2026"
+        # "Can you tell me the round-trip air ticket from  London to New York JFK aiport, the departure time is February 17, 2025, and the return time is February 23, 2025",
+        # "Book a hotel in New York from Feb 20,2026 to Feb 24,2026",
         """Help me book flight tickets and hotel for the following trip 
         New York JFK Feb 20th 2026 to London Heathrow LHR returning Feb 27th 2026 
         flying economy with British Airways only. 
         I want a stay in a Hilton hotel in London 
-        please provide costs for the flight and hotel"""
+        please provide costs for the flight and hotel""",
         # "I have a business trip from London LHR to New York JFK on Feb 20th 2026 to Feb 27th 2026, can you help me to book a hotel and flight tickets"
     ]
 
-    user_message = user_inputs[0]
-    print(f"👤 User: {user_message}")
-
-    response1 = await agent.run(user_message, thread=thread)
-
-    print("\n")
-    # 📋 View Raw Response Object
-    # This shows the complete response structure including metadata
-    # Useful for debugging and understanding the response format
-    # print("\n📝 Raw Response Object:")
-    # print(response1) 
-
+    # 🧵 Conversation Management Pattern
+    # The saved thread is only resumed when a single prompt is configured
+    resume_thread = resume_thread_enabled() and len(user_inputs) == 1
+
+    # ⚡ Batch Pattern
+    # All prompts run concurrently, each with its own agent and thread, so total time is
+    # the slowest prompt rather than the sum of all of them. The semaphore caps
+    # in-flight requests to stay within Azure OpenAI rate limits
+    semaphore = asyncio.Semaphore(8)
+
+    async def run_one(index, user_message):
+        agent = create_agent()
+        async with semaphore:
+            thread = await load_thread(agent, THREAD_PATH) if resume_thread else agent.get_new_thread()
+            if index == 0:
+                # 📖 Stream the first reply as it arrives, so partial tables show up
+                # while later tool calls are still running
+                print(f"👤 User: {user_message}")
+                print("\n")
+                print("🏖️ Booking details:")
+                async for update in agent.run_stream(user_message, thread=thread):
+                    if update.text:
+                        print(update.text, end="", flush=True)
+                print("\n")
+                response_text = None
+            else:
+                # Other replies are buffered so concurrent output does not interleave
+                response_text = (await agent.run(user_message, thread=thread)).text
+
+            # 💾 Save the conversation so the next run continues it
+            if resume_thread:
+                await save_thread(thread, THREAD_PATH)
+        return response_text
+
+    try:
+        # return_exceptions keeps one failed prompt from discarding the others' results
+        results = await asyncio.gather(
+            *(run_one(i, u) for i, u in enumerate(user_inputs)), return_exceptions=True
+        )
 
-    # 📖 Extract and Display the booking details
-    # Use the response's text property which handles different content types
-    print("🏖️ Booking details:")
-    print(response1.text)
+        # 📖 Display the buffered booking details, and any prompt that failed
+        for user_message, result in zip(user_inputs, results):
+            if isinstance(result, Exception):
+                print(f"👤 User: {user_message}")
+                print(f"❌ Request failed: {result!r}")
+                print("\n")
+            elif result is not None:
+                print(f"👤 User: {user_message}")
+                print("\n")
+                print("🏖️ Booking details:")
+                print(result)
+                print("\n")
+    finally:
+        # 🧹 Release pooled SerpAPI connections before the event loop closes
+        if _serp_client.cache_info().currsize:
+            await _serp_client().aclose()
+            _serp_client.cache_clear()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+# 🧰 Shared helpers for the Microsoft Agent Framework travel samples
+# The lesson scripts (01, 03, 04) all talk to the same Azure OpenAI deployment,
+# so the chat client is built here once and shared instead of being duplicated
+# in every file.
+#
+# The scripts import this module by name, so run them from the repository root
+# with the root on the module search path, e.g.:
+#   PYTHONPATH=. python 04-tool-use/code_samples/04-python-agent-framework-bookinghotel.py
+# The matching .ipynb notebooks stay self-contained and build their clients inline.
+
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agent_framework.azure import AzureOpenAIChatClient
+
+log = logging.getLogger(__name__)
+
+
+# 🌐 Azure OpenAI Client Factory
+# lru_cache turns this into a process-wide singleton: every caller gets the same
+# client, so a single underlying HTTP connection pool is reused across agent runs
+# Environment variables required:
+# - AZURE_OPENAI_API_KEY: Your Azure OpenAI API key
+# - AZURE_OPENAI_ENDPOINT: Your Azure OpenAI endpoint URL
+# - AZURE_OPENAI_CHAT_DEPLOYMENT_NAME: Deployment name of the chat model
+# - AZURE_OPENAI_API_VERSION: API version to use (e.g., 2024-10-21)
+@lru_cache(maxsize=1)
+def get_azure_client() -> "AzureOpenAIChatClient":
+    """Get the shared Azure OpenAI chat client.
+
+    Returns:
+        AzureOpenAIChatClient: A client configured from the AZURE_OPENAI_* environment variables
+    """
+    # Imported here so the Azure client stack only loads once a client is needed
+    from agent_framework.azure import AzureOpenAIChatClient
+
+    return AzureOpenAIChatClient(
+        api_key=os.environ["AZURE_OPENAI_API_KEY"],
+        endpoint=os.environ["AZURE_OPENAI_ENDPOINT"],
+        deployment_name=os.environ["AZURE_OPENAI_CHAT_DEPLOYMENT_NAME"],
+        # Optional: when unset, agent_framework falls back to its default API version
+        api_version=os.environ.get("AZURE_OPENAI_API_VERSION"),
+    )
+
+
+# 🛠️ Tool Name Helper
+# Plain functions expose __name__, while @ai_function tools expose name (and wrap
+# the original callable in func), so one helper covers both kinds of tool.
+# The samples log these names at DEBUG level behind log.isEnabledFor(logging.DEBUG),
+# so the list is only built when debugging. To see it, add
+# logging.basicConfig(level=logging.DEBUG) at the top of a sample
+def tool_names(tools) -> list[str]:
+    """Get display names for a list of agent tools.
+
+    Returns:
+        list[str]: The name of each tool, in order
+    """
+    return [
+        getattr(tool, "name", None) or getattr(tool, "__name__", None) or tool.func.__name__
+        for tool in tools
+    ]
+
+
+# 🧵 Thread Persistence Helpers
+# Saving the conversation thread between runs lets the next run continue the same
+# conversation. The trade-off: every resumed run resends the whole earlier conversation
+# (including tool results), so input tokens grow with each run. Resuming is therefore
+# opt-in; delete the saved thread file to start over
+def resume_thread_enabled() -> bool:
+    """Check whether the samples should resume their saved conversation thread.
+
+    Set AGENT_RESUME_THREAD=true (environment or .env) to opt in.
+
+    Returns:
+        bool: True if the saved thread should be loaded and saved
+    """
+    return os.environ.get("AGENT_RESUME_THREAD", "").strip().lower() in ("1", "true", "yes")
+
+
+async def load_thread(agent, path):
+    """Resume the agent's saved conversation thread, or start a new one.
+
+    A missing, unreadable, or corrupt thread file falls back to a new thread.
+
+    Returns:
+        AgentThread: The thread stored at path, or a new thread if none could be loaded
+    """
+    if not os.path.exists(path):
+        return agent.get_new_thread()
+    try:
+        with open(path, encoding="utf-8") as f:
+            serialized_thread = json.load(f)
+        return await agent.deserialize_thread(serialized_thread)
+    except Exception as exc:  # JSON, file, or framework deserialization errors
+        log.warning("Could not resume saved thread from %s, starting a new one: %r", path, exc)
+        return agent.get_new_thread()
+
+
+async def save_thread(thread, path):
+    """Save the conversation thread so the next run can resume it.
+
+    The thread is written to a temporary file first and then moved into place, so an
+    interrupted save never leaves a truncated file behind.
+    """
+    serialized_thread = await thread.serialize()
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(serialized_thread, f)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)